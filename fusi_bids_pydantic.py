@@ -3,12 +3,15 @@
 Ported from https://bids.neuroimaging.io/bep040
 """
 
+import logging
+import operator
+import os
 import warnings
 from enum import Enum
-from typing import Annotated, Any, ClassVar, Optional, Union
+from itertools import combinations, islice
+from typing import Annotated, Any, ClassVar, Literal, Optional, Union, get_args
 
 from pydantic import (
-    AfterValidator,
     AnyUrl,
     BaseModel,
     ConfigDict,
@@ -24,88 +27,188 @@ from pydantic import (
 )
 
 
-def warn_if_none(value: Any, info: ValidationInfo) -> Any:
-    """AfterValidator for RECOMMENDED fields.
+class _Recommended:
+    """Marker for RECOMMENDED fields, used as ``Annotated`` metadata."""
 
-    This validator will warn if the field is None.
+    def __repr__(self) -> str:
+        return "RECOMMENDED"
+
+
+_RECOMMENDED = _Recommended()
+
+# Shared annotations for the most common RECOMMENDED field types
+_RecommendedStr = Annotated[Optional[str], _RECOMMENDED]
+_RecommendedFloat = Annotated[Optional[float], _RECOMMENDED]
+_RecommendedPositiveFloat = Annotated[Optional[PositiveFloat], _RECOMMENDED]
+_RecommendedAngles = Annotated[
+    Optional[Union[FiniteFloat, list[FiniteFloat]]], _RECOMMENDED
+]
+
+logger = logging.getLogger(__name__)
+
+RecommendedWarningsMode = Literal["warn", "log", "off"]
+
+# FUSI_BIDS_RECOMMENDED_WARNINGS values; "0" is kept as an alias for "off"
+_RECOMMENDED_WARNINGS_ENV: dict[str, RecommendedWarningsMode] = {
+    "warn": "warn",
+    "log": "log",
+    "off": "off",
+    "0": "off",
+}
+
+
+def _recommended_warnings_mode_from_env(value: str) -> RecommendedWarningsMode:
+    """Map a FUSI_BIDS_RECOMMENDED_WARNINGS value to a mode, "warn" if unset.
+
+    Unknown values warn and fall back to "warn" rather than being ignored.
     """
-    if value is None:
-        warnings.warn(f"RECOMMENDED field {info.field_name} is not set.", stacklevel=2)
-    return value
+    if not value:
+        return "warn"
+    mode = _RECOMMENDED_WARNINGS_ENV.get(value.strip().lower())
+    if mode is None:
+        warnings.warn(
+            f"Unknown RECOMMENDED warnings mode in FUSI_BIDS_RECOMMENDED_WARNINGS: "
+            f"{value!r}, expected one of {sorted(_RECOMMENDED_WARNINGS_ENV)}; "
+            "using 'warn'.",
+            stacklevel=2,
+        )
+        return "warn"
+    return mode
 
 
-class Hardware(BaseModel):
-    """Scanner and probe hardware information."""
+# How unset RECOMMENDED fields are reported: "warn" emits a UserWarning,
+# "log" reports through `logger`, and "off" skips the check entirely
+_RECOMMENDED_WARNINGS_MODE: RecommendedWarningsMode = (
+    _recommended_warnings_mode_from_env(
+        os.environ.get("FUSI_BIDS_RECOMMENDED_WARNINGS", "")
+    )
+)
+
+
+def configure_recommended_warnings(mode: RecommendedWarningsMode) -> None:
+    """Set how unset RECOMMENDED fields are reported, for all models.
+
+    "warn" emits a UserWarning per field (the default), "log" reports through
+    the module logger, and "off" skips the check so validation pays nothing for it.
+    Overrides the FUSI_BIDS_RECOMMENDED_WARNINGS environment variable.
+    """
+    global _RECOMMENDED_WARNINGS_MODE
+    if mode not in get_args(RecommendedWarningsMode):
+        raise ValueError(f"Unknown RECOMMENDED warnings mode: {mode!r}")
+    _RECOMMENDED_WARNINGS_MODE = mode
+
+
+class _FUSIBase(BaseModel):
+    """Base model with the shared config, warning about unset RECOMMENDED fields."""
 
     model_config = ConfigDict(
-        extra="allow",
+        extra="ignore",
         frozen=True,  # adds __hash__ method
         populate_by_name=True,
-        validate_default=True,
+        defer_build=True,  # build schema on first use, not at import
     )
-    manufacturer: Annotated[Optional[str], AfterValidator(warn_if_none)] = Field(
+
+    # Names of the fields marked RECOMMENDED, collected once per class
+    recommended_fields: ClassVar[tuple[str, ...]] = ()
+    # (field name, warning message) pairs, formatted once per class
+    _recommended_warnings: ClassVar[tuple[tuple[str, str], ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.recommended_fields = tuple(
+            name
+            for name, field in cls.model_fields.items()
+            if _RECOMMENDED in field.metadata
+        )
+        cls._recommended_warnings = tuple(
+            (name, f"RECOMMENDED field {name} is not set.")
+            for name in cls.recommended_fields
+        )
+
+    @model_validator(mode="after")
+    def warn_unset_recommended_fields(self) -> "_FUSIBase":
+        """Warn once per RECOMMENDED field that is None.
+
+        A single sweep after validation, rather than a validator on each field.
+        """
+        if _RECOMMENDED_WARNINGS_MODE == "off":
+            return self
+        if _RECOMMENDED_WARNINGS_MODE == "log":
+            # No stack walk, and no formatting unless the message is emitted
+            if logger.isEnabledFor(logging.WARNING):
+                for name in self.recommended_fields:
+                    if getattr(self, name) is None:
+                        logger.warning("RECOMMENDED field %s is not set.", name)
+            return self
+        for name, message in self._recommended_warnings:
+            if getattr(self, name) is None:
+                warnings.warn(message, stacklevel=2)
+        return self
+
+
+class Hardware(_FUSIBase):
+    """Scanner and probe hardware information."""
+
+    manufacturer: _RecommendedStr = Field(
         None,
         description="Manufacturer of the ultrasound scanner that produced the measurements.",
         alias="Manufacturer",
     )
-    manufacturers_model_name: Annotated[Optional[str], AfterValidator(warn_if_none)] = (
-        Field(
-            None,
-            description="Manufacturer's model name of the ultrasound scanner that produced the measurements.",
-            alias="ManufacturersModelName",
-        )
+    manufacturers_model_name: _RecommendedStr = Field(
+        None,
+        description="Manufacturer's model name of the ultrasound scanner that produced the measurements.",
+        alias="ManufacturersModelName",
     )
-    device_serial_number: Annotated[Optional[str], AfterValidator(warn_if_none)] = (
-        Field(
-            None,
-            description="The serial number of the ultrasound scanner that produced the measurements. "
-            "A pseudonym can also be used to prevent the equipment from being identifiable, "
-            "so long as each pseudonym is unique within the dataset.",
-            alias="DeviceSerialNumber",
-        )
+    device_serial_number: _RecommendedStr = Field(
+        None,
+        description="The serial number of the ultrasound scanner that produced the measurements. "
+        "A pseudonym can also be used to prevent the equipment from being identifiable, "
+        "so long as each pseudonym is unique within the dataset.",
+        alias="DeviceSerialNumber",
     )
-    station_name: Annotated[Optional[str], AfterValidator(warn_if_none)] = Field(
+    station_name: _RecommendedStr = Field(
         None,
         description="Institution-defined name of the ultrasound scanner that produced the measurements.",
         alias="StationName",
     )
-    software_versions: Annotated[Optional[str], AfterValidator(warn_if_none)] = Field(
+    software_versions: _RecommendedStr = Field(
         None,
         description="Manufacturer's designation of the software version of the ultrasound scanner "
         "that produced the measurements.",
         alias="SoftwareVersions",
     )
-    probe_manufacturer: Annotated[Optional[str], AfterValidator(warn_if_none)] = Field(
+    probe_manufacturer: _RecommendedStr = Field(
         None,
         description="Manufacturer of the ultrasound probe that produced the measurements.",
         alias="ProbeManufacturer",
     )
-    probe_type: Annotated[Optional[str], AfterValidator(warn_if_none)] = Field(
+    probe_type: _RecommendedStr = Field(
         None,
         description="Information describing the ultrasound probe type, e.g. linear, RCA, multiarray, etc.).",
         alias="ProbeType",
     )
-    probe_model: Annotated[Optional[str], AfterValidator(warn_if_none)] = Field(
+    probe_model: _RecommendedStr = Field(
         None,
         description="Manufacturer's model name of the ultrasound probe used to produce the measurements.",
         alias="ProbeModel",
     )
-    probe_serial_number: Annotated[Optional[str], AfterValidator(warn_if_none)] = Field(
+    probe_serial_number: _RecommendedStr = Field(
         None,
         description="The serial number of the ultrasound probe that produced the measurements. "
         "A pseudonym can also be used to prevent the equipment from being identifiable, "
         "so long as each pseudonym is unique within the dataset.",
         alias="ProbeSerialNumber",
     )
-    probe_central_frequency_mhz: Annotated[
-        Optional[NonNegativeFloat], AfterValidator(warn_if_none)
-    ] = Field(
-        None,
-        description="Central frequency of the ultrasound probe, in megahertz.",
-        alias="ProbeCentralFrequency",
+    probe_central_frequency_mhz: Annotated[Optional[NonNegativeFloat], _RECOMMENDED] = (
+        Field(
+            None,
+            description="Central frequency of the ultrasound probe, in megahertz.",
+            alias="ProbeCentralFrequency",
+        )
     )
     probe_number_of_elements: Annotated[
-        Optional[Union[PositiveInt, list[PositiveInt]]], AfterValidator(warn_if_none)
+        Optional[Union[PositiveInt, list[PositiveInt]]], _RECOMMENDED
     ] = Field(
         None,
         description="Number of probe transducers along each probe axis (e.g. [32, 32] for a 32x32 matrix probe).",
@@ -113,101 +216,68 @@ class Hardware(BaseModel):
     )
     probe_pitch_mm: Annotated[
         Optional[Union[PositiveFloat, list[PositiveFloat]]],
-        AfterValidator(warn_if_none),
+        _RECOMMENDED,
     ] = Field(
         None,
         description="Inter-element pitch of the probe, in millimeters. Can be provided as a single number, "
         "or as an array of probe pitches along the [azimuth, elevation] directions.",
         alias="ProbePitch",
     )
-    probe_radius_of_curvature_deg: Annotated[
-        Optional[float], AfterValidator(warn_if_none)
-    ] = Field(
+    probe_radius_of_curvature_deg: _RecommendedFloat = Field(
         None,
         description="Radius of curvature of the probe, in degrees.",
         alias="ProbeRadiusOfCurvature",
+        ge=0,
+        le=360,
     )
-    probe_elevation_width_mm: Annotated[
-        Optional[PositiveFloat], AfterValidator(warn_if_none)
-    ] = Field(
+    probe_elevation_width_mm: _RecommendedPositiveFloat = Field(
         None,
         description="Elevation width at the probe focal point, in millimeters.",
         alias="ProbeElevationWidth",
     )
-    probe_elevation_aperture_mm: Annotated[
-        Optional[PositiveFloat], AfterValidator(warn_if_none)
-    ] = Field(
+    probe_elevation_aperture_mm: _RecommendedPositiveFloat = Field(
         None,
         description="Elevation aperture of the probe, in millimeters.",
         alias="ProbeElevationAperture",
     )
-    probe_elevation_focus_mm: Annotated[
-        Optional[float], AfterValidator(warn_if_none)
-    ] = Field(
+    probe_elevation_focus_mm: _RecommendedFloat = Field(
         None,
         description="Elevation focus of the probe, in millimeters.",
         alias="ProbeElevationFocus",
     )
 
-    @field_validator("probe_radius_of_curvature_deg")
-    @classmethod
-    def validate_probe_radius_of_curvature(cls, v: float) -> float:
-        if (v is not None) and (v < 0 or v > 360):
-            raise ValueError(
-                "Probe radius of curvature must be between 0 and 360 degrees"
-            )
-        return v
-
 
-class SequenceSpecifics(BaseModel):
+class SequenceSpecifics(_FUSIBase):
     """Transmit-receive sequence"""
 
-    model_config = ConfigDict(
-        extra="allow",
-        frozen=True,  # adds __hash__ method
-        populate_by_name=True,
-        validate_default=True,
-    )
-    depth_mm: Annotated[Optional[list[FiniteFloat]], AfterValidator(warn_if_none)] = (
-        Field(
-            None,
-            description="Minimal and maximal depth of the field of view from the probe surface, e.g. [4,14], in millimeters.",
-            alias="Depth",
-        )
+    depth_mm: Annotated[Optional[list[FiniteFloat]], _RECOMMENDED] = Field(
+        None,
+        description="Minimal and maximal depth of the field of view from the probe surface, e.g. [4,14], in millimeters.",
+        alias="Depth",
     )
-    ultrasound_transmit_frequency_mhz: Annotated[
-        Optional[PositiveFloat], AfterValidator(warn_if_none)
-    ] = Field(
+    ultrasound_transmit_frequency_mhz: _RecommendedPositiveFloat = Field(
         None,
         description="Ultrasound transmit frequency, in megahertz.",
         alias="UltrasoundTransmitFrequency",
     )
-    ultrasound_pulse_repetition_frequency_hz: Annotated[
-        Optional[PositiveFloat], AfterValidator(warn_if_none)
-    ] = Field(
+    ultrasound_pulse_repetition_frequency_hz: _RecommendedPositiveFloat = Field(
         None,
         description="Pulse repetition frequency, in hertz.",
         alias="UltrasoundPulseRepetitionFrequency",
     )
-    plane_wave_elevation_angles_deg: Annotated[
-        Optional[Union[FiniteFloat, list[FiniteFloat]]], AfterValidator(warn_if_none)
-    ] = Field(
+    plane_wave_elevation_angles_deg: _RecommendedAngles = Field(
         None,
         description="Elevation angles at which tilted plane waves are emitted, in degrees. "
         "If both PlaneWaveElevationAngles and PlaneWaveAzimuthAngles are arrays, they should have the same length.",
         alias="PlaneWaveElevationAngles",
     )
-    plane_wave_azimuth_angles_deg: Annotated[
-        Optional[Union[FiniteFloat, list[FiniteFloat]]], AfterValidator(warn_if_none)
-    ] = Field(
+    plane_wave_azimuth_angles_deg: _RecommendedAngles = Field(
         None,
         description="Azimuth angles at which tilted plane waves are emitted, in degrees. "
         "If both PlaneWaveElevationAngles and PlaneWaveAzimuthAngles are arrays, they should have the same length.",
         alias="PlaneWaveAzimuthAngles",
     )
-    ultrafast_sampling_frequency_hz: Annotated[
-        Optional[PositiveFloat], AfterValidator(warn_if_none)
-    ] = Field(
+    ultrafast_sampling_frequency_hz: _RecommendedPositiveFloat = Field(
         None,
         description="Sampling frequency of the compounded volumes, in hertz. Note that UltrafastSamplingFrequency "
         "should be equal to UltrasoundPulseRepetitionFrequency divided by the number of tilted plane "
@@ -226,7 +296,7 @@ class SequenceSpecifics(BaseModel):
         description="Voltage applied to the probe, in volts.",
         alias="ProbeVoltage",
     )
-    sequence_name: Annotated[Optional[str], AfterValidator(warn_if_none)] = Field(
+    sequence_name: _RecommendedStr = Field(
         None,
         description="Manufacturer's designation of the sequence name.",
         alias="SequenceName",
@@ -273,32 +343,19 @@ class SequenceSpecifics(BaseModel):
         return self
 
 
-class ClutterFilter(BaseModel):
+class ClutterFilter(_FUSIBase):
     """Clutter filter. Allows for extra parameters."""
 
-    model_config = ConfigDict(
-        extra="allow",
-        frozen=True,  # adds __hash__ method
-        populate_by_name=True,
-        validate_default=True,
-    )
+    model_config = ConfigDict(extra="allow")  # filter-specific parameters
     filter_type: str = Field(
         ..., description="Type of clutter filter applied", alias="FilterType"
     )
 
 
-class ClutterFiltering(BaseModel):
+class ClutterFiltering(_FUSIBase):
     """Clutter filtering."""
 
-    model_config = ConfigDict(
-        extra="allow",
-        frozen=True,  # adds __hash__ method
-        populate_by_name=True,
-        validate_default=True,
-    )
-    clutter_filter_window_duration_ms: Annotated[
-        Optional[PositiveFloat], AfterValidator(warn_if_none)
-    ] = Field(
+    clutter_filter_window_duration_ms: _RecommendedPositiveFloat = Field(
         None,
         description="Duration of the clutter filter window, in milliseconds.",
         alias="ClutterFilterWindowDuration",
@@ -309,9 +366,7 @@ class ClutterFiltering(BaseModel):
         "Assumed equal to the ClutterFilterWindowDuration as default.",
         alias="ClutterFilterWindowStride",
     )
-    clutter_filters: Annotated[
-        Optional[list[ClutterFilter]], AfterValidator(warn_if_none)
-    ] = Field(
+    clutter_filters: Annotated[Optional[list[ClutterFilter]], _RECOMMENDED] = Field(
         None,
         description="Clutter filter methods used to remove clutter artifacts.",
         alias="ClutterFilters",
@@ -331,18 +386,10 @@ class ClutterFiltering(BaseModel):
         return self
 
 
-class PowerDopplerIntegration(BaseModel):
+class PowerDopplerIntegration(_FUSIBase):
     """Power Doppler integration window."""
 
-    model_config = ConfigDict(
-        extra="allow",
-        frozen=True,  # adds __hash__ method
-        populate_by_name=True,
-        validate_default=True,
-    )
-    power_doppler_integration_duration_ms: Annotated[
-        Optional[PositiveFloat], AfterValidator(warn_if_none)
-    ] = Field(
+    power_doppler_integration_duration_ms: _RecommendedPositiveFloat = Field(
         None,
         description="Duration of the power Doppler integration window, in milliseconds.",
         alias="PowerDopplerIntegrationDuration",
@@ -379,14 +426,17 @@ class SliceEncodingDirection(str, Enum):
     THIRD_REVERSE = "k-"
 
 
-class TimingParametersBase(BaseModel):
+# Values of SliceEncodingDirection, validated as a Literal (a set lookup in
+# pydantic-core) rather than through the Enum. Fields hold the plain string,
+# which compares equal to the matching SliceEncodingDirection member.
+SliceEncodingDirectionLiteral = Literal["i", "j", "k", "i-", "j-", "k-"]
+
+
+class TimingParametersBase(_FUSIBase):
     """Timing parameters base model."""
 
     model_config = ConfigDict(
-        extra="allow",
-        frozen=True,  # adds __hash__ method
-        populate_by_name=True,
-        validate_default=True,
+        validate_default=True,  # DelayTime defaults to 0 via its validator
     )
     volume_timing_s: Optional[list[NonNegativeFloat]] = Field(
         None,
@@ -425,7 +475,7 @@ class TimingParametersBase(BaseModel):
         alias="SliceTiming",
     )
     slice_encoding_direction: Annotated[
-        Optional[SliceEncodingDirection], AfterValidator(warn_if_none)
+        Optional[SliceEncodingDirectionLiteral], _RECOMMENDED
     ] = Field(
         None,
         description="The axis of the NIfTI data along which slices were acquired, and the "
@@ -456,20 +506,19 @@ class TimingParametersBase(BaseModel):
         alias="AcquisitionDuration",
         gt=0,
     )
-    delay_after_trigger_s: Annotated[Optional[float], AfterValidator(warn_if_none)] = (
-        Field(
-            None,
-            description="Duration (in seconds) from trigger delivery to scan onset. This delay "
-            "is commonly caused by adjustments, loading times, or robot movement.",
-            alias="DelayAfterTrigger",
-            ge=0,
-        )
+    delay_after_trigger_s: _RecommendedFloat = Field(
+        None,
+        description="Duration (in seconds) from trigger delivery to scan onset. This delay "
+        "is commonly caused by adjustments, loading times, or robot movement.",
+        alias="DelayAfterTrigger",
+        ge=0,
     )
 
     @field_validator("volume_timing_s")
     @classmethod
     def validate_volume_timing_monotonic(cls, v: list[float]) -> list[float]:
-        if (v is not None) and (not all(v[i] <= v[i + 1] for i in range(len(v) - 1))):
+        # Pairwise v[i] <= v[i + 1], compared in C rather than a Python-level loop
+        if (v is not None) and (not all(map(operator.le, v, islice(v, 1, None)))):
             raise ValueError("Values must be monotonically increasing")
         return v
 
@@ -512,64 +561,137 @@ class TimingOptionConfigError(ValueError):
 class TimingOptionBase(TimingParametersBase):
     """Base class for timing options with shared validation logic."""
 
-    required_fields: ClassVar[set[str]] = set()
-    forbidden_fields: ClassVar[set[str]] = set()
+    required_fields: ClassVar[frozenset[str]] = frozenset()
+    forbidden_fields: ClassVar[frozenset[str]] = frozenset()
+
+    @classmethod
+    def _timing_error(
+        cls, present: frozenset[str]
+    ) -> Optional[TimingOptionConfigError]:
+        """Check the set of present (non-None) timing fields against this option.
+
+        Returns the error to raise, or None if the fields match this option.
+        """
+        # Fast path: a match needs no intermediate lists or message formatting
+        if cls.required_fields <= present and cls.forbidden_fields.isdisjoint(present):
+            return None
 
-    @model_validator(mode="after")
-    def validate_timing_requirements(self) -> "TimingOptionBase":
         # Check required fields
-        missing_fields = [
-            field for field in self.required_fields if getattr(self, field) is None
-        ]
+        missing_fields = cls.required_fields - present
         if missing_fields:
-            raise TimingOptionConfigError(
-                self.__class__.__name__, f"requires {', '.join(missing_fields)}"
+            return TimingOptionConfigError(
+                cls.__name__, f"requires {', '.join(sorted(missing_fields))}"
             )
 
         # Check forbidden fields
-        present_forbidden = [
-            field for field in self.forbidden_fields if getattr(self, field) is not None
-        ]
+        present_forbidden = cls.forbidden_fields & present
         if present_forbidden:
-            raise TimingOptionConfigError(
-                self.__class__.__name__, f"must not have {', '.join(present_forbidden)}"
+            return TimingOptionConfigError(
+                cls.__name__, f"must not have {', '.join(sorted(present_forbidden))}"
             )
+        return None
+
+    @model_validator(mode="after")
+    def validate_timing_requirements(self) -> "TimingOptionBase":
+        cls = type(self)
+        present = frozenset(
+            field
+            for field in cls.required_fields | cls.forbidden_fields
+            if getattr(self, field) is not None
+        )
+        error = cls._timing_error(present)
+        if error is not None:
+            raise error
         return self
 
 
 class TimingOptionA(TimingOptionBase):
     """Timing option A."""
 
-    required_fields = {"repetition_time_s"}
-    forbidden_fields = {"acquisition_duration_s", "volume_timing_s"}
+    required_fields = frozenset({"repetition_time_s"})
+    forbidden_fields = frozenset({"acquisition_duration_s", "volume_timing_s"})
 
 
 class TimingOptionB(TimingOptionBase):
     """Timing option B."""
 
-    required_fields = {"slice_timing_s", "volume_timing_s"}
-    forbidden_fields = {"repetition_time_s", "acquisition_duration_s", "delay_time_s"}
+    required_fields = frozenset({"slice_timing_s", "volume_timing_s"})
+    forbidden_fields = frozenset({
+        "repetition_time_s",
+        "acquisition_duration_s",
+        "delay_time_s",
+    })
 
 
 class TimingOptionC(TimingOptionBase):
     """Timing option C."""
 
-    required_fields = {"acquisition_duration_s", "volume_timing_s"}
-    forbidden_fields = {"repetition_time_s", "slice_timing_s", "delay_time_s"}
+    required_fields = frozenset({"acquisition_duration_s", "volume_timing_s"})
+    forbidden_fields = frozenset({
+        "repetition_time_s",
+        "slice_timing_s",
+        "delay_time_s",
+    })
 
 
 class TimingOptionD(TimingOptionBase):
     """Timing option D."""
 
-    required_fields = {"repetition_time_s", "slice_timing_s"}
-    forbidden_fields = {"acquisition_duration_s", "volume_timing_s"}
+    required_fields = frozenset({"repetition_time_s", "slice_timing_s"})
+    forbidden_fields = frozenset({"acquisition_duration_s", "volume_timing_s"})
 
 
 class TimingOptionE(TimingOptionBase):
     """Timing option E."""
 
-    required_fields = {"repetition_time_s", "delay_time_s"}
-    forbidden_fields = {"slice_timing_s", "acquisition_duration_s", "volume_timing_s"}
+    required_fields = frozenset({"repetition_time_s", "delay_time_s"})
+    forbidden_fields = frozenset({
+        "slice_timing_s",
+        "acquisition_duration_s",
+        "volume_timing_s",
+    })
+
+
+_TIMING_OPTIONS: tuple[type[TimingOptionBase], ...] = (
+    TimingOptionA,
+    TimingOptionB,
+    TimingOptionC,
+    TimingOptionD,
+    TimingOptionE,
+)
+
+# Fields that decide which timing option applies, with their aliases
+_TIMING_FIELDS: tuple[str, ...] = (
+    "volume_timing_s",
+    "repetition_time_s",
+    "slice_timing_s",
+    "delay_time_s",
+    "acquisition_duration_s",
+)
+_TIMING_FIELD_ALIASES: dict[str, str] = {
+    field: TimingParametersBase.model_fields[field].alias or field
+    for field in _TIMING_FIELDS
+}
+
+
+def _match_timing_options() -> dict[frozenset[str], type[TimingOptionBase]]:
+    """Map every combination of present timing fields to the first option it matches.
+
+    Combinations that match no option are left out.
+    """
+    matches = {}
+    for size in range(len(_TIMING_FIELDS) + 1):
+        for fields in combinations(_TIMING_FIELDS, size):
+            present = frozenset(fields)
+            for option_class in _TIMING_OPTIONS:
+                if option_class._timing_error(present) is None:
+                    matches[present] = option_class
+                    break
+    return matches
+
+
+# Built once at import, so checking an instance is a single dict lookup
+_TIMING_OPTION_BY_PRESENT_FIELDS = _match_timing_options()
 
 
 class TimingParameters(TimingParametersBase):
@@ -577,51 +699,48 @@ class TimingParameters(TimingParametersBase):
 
     @model_validator(mode="after")
     def validate_timing_options(self) -> "TimingParameters":
-        data = self.model_dump(by_alias=True, round_trip=True, exclude_unset=True)
-        errors = []
-
-        # Try each timing option
-        for option_class in (
-            TimingOptionA,
-            TimingOptionB,
-            TimingOptionC,
-            TimingOptionD,
-            TimingOptionE,
-        ):
-            try:
-                option_class.model_validate(data)
-            except ValidationError as err:
-                errors.append(err)
-            else:
-                return self
-
-        # Raise a single error that includes all the line-errors
-        all_line_errors = []
-        for validation_error in errors:
-            line_errors = validation_error.errors()
-            all_line_errors.extend(line_errors)
+        # The fields have already been validated, so we only need to look up
+        # which combination of them is present, not re-validate each option
+        present = frozenset(
+            field for field in _TIMING_FIELDS if getattr(self, field) is not None
+        )
+        if present in _TIMING_OPTION_BY_PRESENT_FIELDS:
+            return self
+
+        # Raise a single error that includes the reason each option was rejected
+        errors = [
+            error
+            for option_class in _TIMING_OPTIONS
+            if (error := option_class._timing_error(present)) is not None
+        ]
+        data = {
+            _TIMING_FIELD_ALIASES[field]: getattr(self, field)
+            for field in _TIMING_FIELDS
+            if field in present
+        }
         raise ValidationError.from_exception_data(
             title="TimingParameters: no valid timing option found (A-E)",
-            # This is a Python-Rust wrapper, so we need to ignore the type error
-            line_errors=all_line_errors,  # type: ignore[arg-type]
+            line_errors=[
+                {
+                    "type": "value_error",
+                    "loc": (),
+                    "input": data,
+                    "ctx": {"error": error},
+                }
+                for error in errors
+            ],
         )
 
 
-class TaskInformation(BaseModel):
+class TaskInformation(_FUSIBase):
     """Behavioral/cognitive task."""
 
-    model_config = ConfigDict(
-        extra="allow",
-        frozen=True,  # adds __hash__ method
-        populate_by_name=True,
-        validate_default=True,
-    )
     task_name: str = Field(
         ...,
         description="Name of the task. No two tasks should have the same name.",
         alias="TaskName",
     )
-    task_description: Annotated[Optional[str], AfterValidator(warn_if_none)] = Field(
+    task_description: _RecommendedStr = Field(
         None,
         description="Longer description of the task.",
         alias="TaskDescription",
@@ -638,28 +757,20 @@ class TaskInformation(BaseModel):
     )
 
 
-class InstitutionInformation(BaseModel):
+class InstitutionInformation(_FUSIBase):
     """Experiment institution."""
 
-    model_config = ConfigDict(
-        extra="allow",
-        frozen=True,  # adds __hash__ method
-        populate_by_name=True,
-        validate_default=True,
-    )
-    institution_name: Annotated[Optional[str], AfterValidator(warn_if_none)] = Field(
+    institution_name: _RecommendedStr = Field(
         None,
         description="The name of the institution in charge of the equipment that produced the measurements.",
         alias="InstitutionName",
     )
-    institution_address: Annotated[Optional[str], AfterValidator(warn_if_none)] = Field(
+    institution_address: _RecommendedStr = Field(
         None,
         description="The address of the institution in charge of the equipment that produced the measurements.",
         alias="InstitutionAddress",
     )
-    institutional_department_name: Annotated[
-        Optional[str], AfterValidator(warn_if_none)
-    ] = Field(
+    institutional_department_name: _RecommendedStr = Field(
         None,
         description="The department in the institution in charge of the equipment that produced the measurements.",
         alias="InstitutionalDepartmentName",
@@ -677,9 +788,23 @@ class FUSISidecar(
 ):
     """Complete fUSI-BIDS sidecar JSON specification model."""
 
-    model_config = ConfigDict(
-        extra="allow",
-        frozen=True,  # adds __hash__ method
-        populate_by_name=True,
-        validate_default=True,
-    )
+    model_config = ConfigDict(extra="allow", validate_default=True)
+
+    @classmethod
+    def from_json_bytes(cls, data: bytes) -> "FUSISidecar":
+        """Validate a sidecar from raw JSON bytes, e.g. from ``Path.read_bytes()``.
+
+        The JSON is parsed and validated in one pass by pydantic-core,
+        without building an intermediate dict as ``json.load`` would.
+        """
+        return cls.model_validate_json(data)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize the sidecar to JSON bytes with BIDS keys, e.g. for ``Path.write_bytes()``.
+
+        Unset (``None``) fields are omitted, as in a BIDS sidecar. The output
+        can be read back with :meth:`from_json_bytes`.
+        """
+        return self.__pydantic_serializer__.to_json(
+            self, by_alias=True, exclude_none=True
+        )
@@ -0,0 +1,121 @@
+"""Shared fixtures for fUSI-BIDS model tests."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def hardware_data():
+    """Valid hardware data fixture."""
+    return {
+        # Scanner hardware
+        "Manufacturer": "Example Manufacturer",
+        "ManufacturersModelName": "Example Model",
+        "DeviceSerialNumber": "123456",
+        "StationName": "Scanner1",
+        "SoftwareVersions": "1.0.0",
+        # Probe hardware
+        "ProbeManufacturer": "Example Probe Manufacturer",
+        "ProbeType": "linear",
+        "ProbeModel": "Example Probe Model",
+        "ProbeSerialNumber": "PROBE123456",
+        "ProbeCentralFrequency": 15.0,
+        "ProbeNumberOfElements": (32, 32),
+        "ProbePitch": 0.3,
+        "ProbeRadiusOfCurvature": 180.0,
+        "ProbeElevationWidth": 0.5,
+        "ProbeElevationAperture": 1.0,
+        "ProbeElevationFocus": 2.0,
+    }
+
+
+@pytest.fixture(scope="session")
+def sequence_data():
+    """Valid sequence specifics data fixture."""
+    return {
+        "Depth": (4.0, 14.0),
+        "UltrasoundTransmitFrequency": 15.0,
+        "UltrasoundPulseRepetitionFrequency": 1000.0,
+        "PlaneWaveElevationAngles": (-10.0, 0.0, 10.0),
+        "PlaneWaveAzimuthAngles": (-5.0, 0.0, 5.0),
+        "UltrafastSamplingFrequency": 333.33,
+        "SequenceName": "Example Sequence",
+    }
+
+
+@pytest.fixture(scope="session")
+def clutter_filtering_data():
+    """Valid clutter filtering data fixture."""
+    return {
+        "ClutterFilterWindowDuration": 100.0,
+        "ClutterFilterWindowStride": 50.0,
+        "ClutterFilters": [{"FilterType": "SVD"}],
+    }
+
+
+@pytest.fixture(scope="session")
+def power_doppler_data():
+    """Valid power Doppler integration data fixture."""
+    return {
+        "PowerDopplerIntegrationDuration": 100.0,
+        "PowerDopplerIntegrationStride": 50.0,
+    }
+
+
+@pytest.fixture(scope="session")
+def task_data():
+    """Valid task information data fixture."""
+    return {
+        "TaskName": "rest",
+        "TaskDescription": "Resting state acquisition",
+        "CogAtlasID": "http://example.com",
+    }
+
+
+@pytest.fixture(scope="session")
+def institution_data():
+    """Valid institution information data fixture."""
+    return {
+        "InstitutionName": "Example University",
+        "InstitutionAddress": "123 Example St",
+        "InstitutionalDepartmentName": "Neuroscience",
+    }
+
+
+@pytest.fixture(scope="session")
+def timing_options_common_data():
+    """Common data for timing options."""
+    return {
+        "SliceEncodingDirection": "i",
+        "DelayAfterTrigger": 0.5,
+    }
+
+
+@pytest.fixture(scope="session")
+def timing_option_a_data(timing_options_common_data):
+    """Valid timing option A data fixture."""
+    return {
+        "RepetitionTime": 1.5,
+        **timing_options_common_data,
+    }
+
+
+@pytest.fixture(scope="session")
+def complete_sidecar_data(
+    hardware_data,
+    sequence_data,
+    clutter_filtering_data,
+    power_doppler_data,
+    task_data,
+    timing_option_a_data,
+    institution_data,
+):
+    """Valid data for a complete sidecar, merged from all section fixtures."""
+    return {
+        **task_data,
+        **hardware_data,
+        **sequence_data,
+        **clutter_filtering_data,
+        **power_doppler_data,
+        **timing_option_a_data,
+        **institution_data,
+    }
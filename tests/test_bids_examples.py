@@ -1,5 +1,6 @@
 """Test validation of fUSI-BIDS example datasets."""
 
+import hashlib
 import json
 from pathlib import Path
 
@@ -24,18 +25,25 @@ def find_pwd_jsons(dataset_path: Path) -> list[Path]:
     return sorted(dataset_path.rglob("*_pwd.json"))
 
 
-def get_unique_contents(json_paths: list[Path]) -> list[Path]:
-    """Filter JSON paths to only those with unique contents."""
-    content_map = {}
-    unique_paths = []
+def get_unique_contents(json_paths: list[Path]) -> list[tuple[Path, dict]]:
+    """Filter JSON paths to only those with unique contents.
+
+    Returns each unique path together with its loaded contents.
+    """
+    # Keep a fixed-size digest of the canonical JSON rather than the full string
+    seen: set[bytes] = set()
+    unique_jsons = []
 
     for path in json_paths:
-        content = json.dumps(load_json(path), sort_keys=True)
-        if content not in content_map:
-            content_map[content] = path
-            unique_paths.append(path)
+        contents = load_json(path)
+        digest = hashlib.blake2b(
+            json.dumps(contents, sort_keys=True).encode(), digest_size=16
+        ).digest()
+        if digest not in seen:
+            seen.add(digest)
+            unique_jsons.append((path, contents))
 
-    return unique_paths
+    return unique_jsons
 
 
 @pytest.fixture
@@ -85,12 +93,9 @@ def test_validate_example_sidecars(dataset_path: Path, pwd_json: dict):
         f"Validating {len(unique_jsons)} unique JSON files out of {len(pwd_jsons)} total files"
     )
 
-    for json_path in unique_jsons:
-        # Load the individual JSON
-        individual_json = load_json(json_path)
-
+    for json_path, individual_json in unique_jsons:
         # Merge with top-level pwd.json
-        merged_json = {**pwd_json, **individual_json}
+        merged_json = pwd_json | individual_json
 
         try:
             # Validate with FUSISidecar model
@@ -100,6 +105,9 @@ def test_validate_example_sidecars(dataset_path: Path, pwd_json: dict):
             assert sidecar.manufacturer == pwd_json["Manufacturer"]
             assert sidecar.task_name == individual_json["TaskName"]
 
+            # The sidecar survives a round trip through JSON bytes
+            assert FUSISidecar.from_json_bytes(sidecar.to_json_bytes()) == sidecar
+
             print(f"✓ Validated {json_path.relative_to(dataset_path)}")
 
         except ValidationError as error:
@@ -1,8 +1,13 @@
 """Unit tests for fUSI-BIDS Pydantic models."""
 
+import json
+import logging
+from typing import Optional, get_args
+
 import pytest
-from pydantic import ValidationError
+from pydantic import Field, ValidationError
 
+import fusi_bids_pydantic
 from fusi_bids_pydantic import (
     ClutterFiltering,
     FUSISidecar,
@@ -11,6 +16,7 @@ from fusi_bids_pydantic import (
     PowerDopplerIntegration,
     SequenceSpecifics,
     SliceEncodingDirection,
+    SliceEncodingDirectionLiteral,
     TaskInformation,
     TimingOptionA,
     TimingOptionB,
@@ -21,170 +27,139 @@ from fusi_bids_pydantic import (
 )
 
 
-@pytest.fixture
-def hardware_data():
-    """Valid hardware data fixture."""
-    return {
-        # Scanner hardware
-        "Manufacturer": "Example Manufacturer",
-        "ManufacturersModelName": "Example Model",
-        "DeviceSerialNumber": "123456",
-        "StationName": "Scanner1",
-        "SoftwareVersions": "1.0.0",
-        # Probe hardware
-        "ProbeManufacturer": "Example Probe Manufacturer",
-        "ProbeType": "linear",
-        "ProbeModel": "Example Probe Model",
-        "ProbeSerialNumber": "PROBE123456",
-        "ProbeCentralFrequency": 15.0,
-        "ProbeNumberOfElements": [32, 32],
-        "ProbePitch": 0.3,
-        "ProbeRadiusOfCurvature": 180.0,
-        "ProbeElevationWidth": 0.5,
-        "ProbeElevationAperture": 1.0,
-        "ProbeElevationFocus": 2.0,
-    }
+def assert_invalid(model_cls, data, match=None):
+    """Assert that validating data with model_cls raises a ValidationError."""
+    with pytest.raises(ValidationError, match=match):
+        model_cls.model_validate(data)
 
 
-@pytest.fixture
-def sequence_data():
-    """Valid sequence specifics data fixture."""
-    return {
-        "Depth": [4.0, 14.0],
-        "UltrasoundTransmitFrequency": 15.0,
-        "UltrasoundPulseRepetitionFrequency": 1000.0,
-        "PlaneWaveElevationAngles": [-10.0, 0.0, 10.0],
-        "PlaneWaveAzimuthAngles": [-5.0, 0.0, 5.0],
-        "UltrafastSamplingFrequency": 333.33,
-        "SequenceName": "Example Sequence",
-    }
+@pytest.fixture(scope="session")
+def hardware_model(hardware_data):
+    """Hardware model validated once from the valid hardware data."""
+    return Hardware.model_validate(hardware_data)
 
 
-@pytest.fixture
-def clutter_filtering_data():
-    """Valid clutter filtering data fixture."""
-    return {
-        "ClutterFilterWindowDuration": 100.0,
-        "ClutterFilterWindowStride": 50.0,
-        "ClutterFilters": [{"FilterType": "SVD"}],
-    }
+@pytest.fixture(scope="session")
+def sequence_model(sequence_data):
+    """SequenceSpecifics model validated once from the valid sequence data."""
+    return SequenceSpecifics.model_validate(sequence_data)
 
 
-@pytest.fixture
-def power_doppler_data():
-    """Valid power Doppler integration data fixture."""
-    return {
-        "PowerDopplerIntegrationDuration": 100.0,
-        "PowerDopplerIntegrationStride": 50.0,
-    }
+@pytest.fixture(scope="session")
+def clutter_filtering_model(clutter_filtering_data):
+    """ClutterFiltering model validated once from the valid clutter filtering data."""
+    return ClutterFiltering.model_validate(clutter_filtering_data)
 
 
-@pytest.fixture
-def task_data():
-    """Valid task information data fixture."""
-    return {
-        "TaskName": "rest",
-        "TaskDescription": "Resting state acquisition",
-        "CogAtlasID": "http://example.com",
-    }
+@pytest.fixture(scope="session")
+def power_doppler_model(power_doppler_data):
+    """PowerDopplerIntegration model validated once from the valid power Doppler data."""
+    return PowerDopplerIntegration.model_validate(power_doppler_data)
 
 
-@pytest.fixture
-def institution_data():
-    """Valid institution information data fixture."""
-    return {
-        "InstitutionName": "Example University",
-        "InstitutionAddress": "123 Example St",
-        "InstitutionalDepartmentName": "Neuroscience",
-    }
+@pytest.fixture(scope="session")
+def task_model(task_data):
+    """TaskInformation model validated once from the valid task data."""
+    return TaskInformation.model_validate(task_data)
 
 
-@pytest.fixture
-def timing_options_common_data():
-    """Common data for timing options."""
-    return {
-        "SliceEncodingDirection": "i",
-        "DelayAfterTrigger": 0.5,
-    }
+@pytest.fixture(scope="session")
+def institution_model(institution_data):
+    """InstitutionInformation model validated once from the valid institution data."""
+    return InstitutionInformation.model_validate(institution_data)
 
 
-@pytest.fixture
-def timing_option_a_data(timing_options_common_data):
-    """Valid timing option A data fixture."""
-    return {
-        "RepetitionTime": 1.5,
-        **timing_options_common_data,
-    }
-
-
-def test_hardware_validation(hardware_data):
+def test_hardware_validation(hardware_data, hardware_model):
     """Test Hardware model validation."""
     # Test valid data
-    hardware = Hardware.model_validate(hardware_data)
-    assert hardware.manufacturer == hardware_data["Manufacturer"]
+    assert hardware_model.manufacturer == hardware_data["Manufacturer"]
     assert (
-        hardware.probe_central_frequency_mhz == hardware_data["ProbeCentralFrequency"]
+        hardware_model.probe_central_frequency_mhz
+        == hardware_data["ProbeCentralFrequency"]
     )
-    assert hardware.probe_number_of_elements == hardware_data["ProbeNumberOfElements"]
-    assert hardware.probe_serial_number == hardware_data["ProbeSerialNumber"]
-
-    # Test invalid probe radius of curvature
-    with pytest.raises(ValidationError):
-        Hardware.model_validate({**hardware_data, "ProbeRadiusOfCurvature": 361.0})
+    assert hardware_model.probe_number_of_elements == list(
+        hardware_data["ProbeNumberOfElements"]
+    )
+    assert hardware_model.probe_serial_number == hardware_data["ProbeSerialNumber"]
+
+
+@pytest.mark.parametrize(
+    ("override", "expect_valid"),
+    [
+        # Probe radius of curvature is an angle in [0, 360]
+        ({"ProbeRadiusOfCurvature": 0.0}, True),
+        ({"ProbeRadiusOfCurvature": 360.0}, True),
+        ({"ProbeRadiusOfCurvature": 361.0}, False),
+        ({"ProbeRadiusOfCurvature": -1.0}, False),
+        # ProbePitch as array
+        ({"ProbePitch": [0.3, 0.4]}, True),
+    ],
+)
+def test_hardware_variants(hardware_data, override, expect_valid):
+    """Test Hardware validation of individual field variants."""
+    data = hardware_data | override
+    if not expect_valid:
+        assert_invalid(Hardware, data)
+        return
 
-    # Test ProbePitch as array
-    pitch_array_data = {**hardware_data, "ProbePitch": [0.3, 0.4]}
-    hardware = Hardware.model_validate(pitch_array_data)
-    assert hardware.probe_pitch_mm == pitch_array_data["ProbePitch"]
+    dumped = Hardware.model_validate(data).model_dump(by_alias=True)
+    assert {key: dumped[key] for key in override} == override
 
 
-def test_sequence_specifics_validation(sequence_data):
+def test_sequence_specifics_validation(sequence_data, sequence_model):
     """Test SequenceSpecifics model validation."""
     # Test valid data
-    seq = SequenceSpecifics.model_validate(sequence_data)
-    assert seq.depth_mm == sequence_data["Depth"]
-    assert (
-        seq.plane_wave_elevation_angles_deg == sequence_data["PlaneWaveElevationAngles"]
+    assert sequence_model.depth_mm == list(sequence_data["Depth"])
+    assert sequence_model.plane_wave_elevation_angles_deg == list(
+        sequence_data["PlaneWaveElevationAngles"]
+    )
+    assert sequence_model.plane_wave_azimuth_angles_deg == list(
+        sequence_data["PlaneWaveAzimuthAngles"]
     )
-    assert seq.plane_wave_azimuth_angles_deg == sequence_data["PlaneWaveAzimuthAngles"]
     assert (
-        seq.ultrasound_transmit_frequency_mhz
+        sequence_model.ultrasound_transmit_frequency_mhz
         == sequence_data["UltrasoundTransmitFrequency"]
     )
 
     # Test invalid depth (max < min)
-    with pytest.raises(ValidationError):
-        SequenceSpecifics.model_validate({**sequence_data, "Depth": [14.0, 4.0]})
+    assert_invalid(SequenceSpecifics, sequence_data | {"Depth": [14.0, 4.0]})
+
+    # Test compound virtual sources are kept as nested lists
+    sources = [[0.0, 0.0, -1.0], [1.0, 0.0, -1.0]]
+    seq = SequenceSpecifics.model_validate(
+        sequence_data | {"CompoundVirtualSources": sources}
+    )
+    assert seq.compound_virtual_sources == sources
 
     # Test plane wave angles validation (arrays of different lengths)
-    with pytest.raises(ValidationError):
-        SequenceSpecifics.model_validate({
-            **sequence_data,
-            "PlaneWaveElevationAngles": [-10.0, 0.0, 10.0],
-            "PlaneWaveAzimuthAngles": [-5.0, 0.0],  # Different length
-        })
+    angles = {
+        "PlaneWaveElevationAngles": [-10.0, 0.0, 10.0],
+        "PlaneWaveAzimuthAngles": [-5.0, 0.0],  # Different length
+    }
+    assert_invalid(SequenceSpecifics, sequence_data | angles)
 
 
-def test_clutter_filtering_validation(clutter_filtering_data):
+def test_clutter_filtering_validation(clutter_filtering_data, clutter_filtering_model):
     """Test ClutterFiltering model validation."""
-    cf = ClutterFiltering.model_validate(clutter_filtering_data)
     assert (
-        cf.clutter_filter_window_duration_ms
+        clutter_filtering_model.clutter_filter_window_duration_ms
         == clutter_filtering_data["ClutterFilterWindowDuration"]
     )
     assert (
-        cf.clutter_filter_window_stride_ms
+        clutter_filtering_model.clutter_filter_window_stride_ms
         == clutter_filtering_data["ClutterFilterWindowStride"]
     )
-    assert len(cf.clutter_filters) == len(clutter_filtering_data["ClutterFilters"])
-    assert (
-        cf.clutter_filters[0].filter_type
-        == clutter_filtering_data["ClutterFilters"][0]["FilterType"]
-    )
+    filters = clutter_filtering_model.clutter_filters
+    expected = clutter_filtering_data["ClutterFilters"]
+    assert len(filters) == len(expected)
+    assert filters[0].filter_type == expected[0]["FilterType"]
 
     # Test stride defaults to duration when not specified
-    single_param_data = clutter_filtering_data.copy()
-    single_param_data.pop("ClutterFilterWindowStride")
+    single_param_data = {
+        key: value
+        for key, value in clutter_filtering_data.items()
+        if key != "ClutterFilterWindowStride"
+    }
     cf = ClutterFiltering.model_validate(single_param_data)
     assert (
         cf.clutter_filter_window_stride_ms
@@ -192,16 +167,15 @@ def test_clutter_filtering_validation(clutter_filtering_data):
     )
 
 
-def test_power_doppler_integration_validation(power_doppler_data):
+def test_power_doppler_integration_validation(power_doppler_data, power_doppler_model):
     """Test PowerDopplerIntegration model validation."""
     # Test with both duration and stride
-    pdi = PowerDopplerIntegration.model_validate(power_doppler_data)
     assert (
-        pdi.power_doppler_integration_duration_ms
+        power_doppler_model.power_doppler_integration_duration_ms
         == power_doppler_data["PowerDopplerIntegrationDuration"]
     )
     assert (
-        pdi.power_doppler_integration_stride_ms
+        power_doppler_model.power_doppler_integration_stride_ms
         == power_doppler_data["PowerDopplerIntegrationStride"]
     )
 
@@ -214,143 +188,184 @@ def test_power_doppler_integration_validation(power_doppler_data):
     )
 
 
-def test_timing_options(timing_option_a_data, timing_options_common_data):
-    """Test various timing options validation."""
-    # Test Option A (RepetitionTime only)
-    timing_a = TimingOptionA.model_validate(timing_option_a_data)
-    assert timing_a.repetition_time_s == timing_option_a_data["RepetitionTime"]
-
-    # Test Option B (SliceTiming and VolumeTiming)
-    timing_option_b_data = {
-        "SliceTiming": [0.0, 0.1, 0.2],
-        "VolumeTiming": [0.0, 1.0, 2.0],
-        **timing_options_common_data,
-    }
-
-    timing_b = TimingOptionB.model_validate(timing_option_b_data)
-    assert timing_b.slice_timing_s == timing_option_b_data["SliceTiming"]
-    assert timing_b.volume_timing_s == timing_option_b_data["VolumeTiming"]
-
-    # Test Option C (AcquisitionDuration and VolumeTiming)
-    option_c = {
-        "AcquisitionDuration": 0.5,
-        "VolumeTiming": [0.0, 1.0, 2.0],
-        **timing_options_common_data,
-    }
-    timing_c = TimingOptionC.model_validate(option_c)
-    assert timing_c.acquisition_duration_s == option_c["AcquisitionDuration"]
-    assert timing_c.volume_timing_s == option_c["VolumeTiming"]
-
-    # Test Option D (RepetitionTime and SliceTiming)
-    option_d = {
-        "RepetitionTime": 1.5,
-        "SliceTiming": [0.0, 0.1, 0.2],
-        **timing_options_common_data,
-    }
-    timing_d = TimingOptionD.model_validate(option_d)
-    assert timing_d.repetition_time_s == option_d["RepetitionTime"]
-    assert timing_d.slice_timing_s == option_d["SliceTiming"]
-
-    # Test Option E (RepetitionTime and DelayTime)
-    option_e = {
-        "RepetitionTime": 1.5,
-        "DelayTime": 0.5,
-        **timing_options_common_data,
-    }
-    timing_e = TimingOptionE.model_validate(option_e)
-    assert timing_e.repetition_time_s == option_e["RepetitionTime"]
-    assert timing_e.delay_time_s == option_e["DelayTime"]
-
-    # Test invalid combinations
-    with pytest.raises(ValidationError, match="must not have acquisition_duration_s"):
-        TimingOptionB.model_validate({
-            "SliceTiming": [0.0, 0.1, 0.2],
-            "VolumeTiming": [0.0, 1.0, 2.0],
-            "AcquisitionDuration": 0.2,  # forbidden in Option B
+@pytest.fixture(scope="session")
+def timing_option_data(timing_option_a_data, timing_options_common_data):
+    """Valid data for each timing option, keyed by option letter."""
+    return {
+        # Option A (RepetitionTime only)
+        "a": timing_option_a_data,
+        # Option B (SliceTiming and VolumeTiming)
+        "b": {
+            "SliceTiming": (0.0, 0.1, 0.2),
+            "VolumeTiming": (0.0, 1.0, 2.0),
             **timing_options_common_data,
-        })
-
-    with pytest.raises(ValidationError, match="monotonically increasing"):
-        TimingOptionB.model_validate({
-            "SliceTiming": [0.0, 0.1, 0.2],
-            "VolumeTiming": [0.0, 2.0, 1.0],  # not monotonically increasing
+        },
+        # Option C (AcquisitionDuration and VolumeTiming)
+        "c": {
+            "AcquisitionDuration": 0.5,
+            "VolumeTiming": (0.0, 1.0, 2.0),
             **timing_options_common_data,
-        })
-
-    with pytest.raises(
-        ValidationError, match="Input should be greater than or equal to 0"
-    ):
-        TimingOptionB.model_validate({
-            "SliceTiming": [0.0, 0.1, 0.2],
-            "VolumeTiming": [-1.0, 0.0, 1.0],  # negative value
+        },
+        # Option D (RepetitionTime and SliceTiming)
+        "d": {
+            "RepetitionTime": 1.5,
+            "SliceTiming": (0.0, 0.1, 0.2),
             **timing_options_common_data,
-        })
-
-    # Test missing required fields
-    with pytest.raises(ValidationError, match="requires volume_timing_s"):
-        TimingOptionB.model_validate({
-            "SliceTiming": [0.0, 0.1, 0.2],
+        },
+        # Option E (RepetitionTime and DelayTime)
+        "e": {
+            "RepetitionTime": 1.5,
+            "DelayTime": 0.5,
             **timing_options_common_data,
-        })
+        },
+    }
 
-    # Test top-level validator
-    with pytest.raises(ValidationError, match="validation errors"):
-        TimingParameters.model_validate({
-            **timing_options_common_data,
-        })
+
+@pytest.mark.parametrize(
+    ("model_cls", "option"),
+    [
+        (TimingOptionA, "a"),
+        (TimingOptionB, "b"),
+        (TimingOptionC, "c"),
+        (TimingOptionD, "d"),
+        (TimingOptionE, "e"),
+    ],
+)
+def test_timing_options(model_cls, option, timing_option_data):
+    """Test validation of each timing option."""
+    data = timing_option_data[option]
+    timing = model_cls.model_validate(data)
+    dumped = timing.model_dump(by_alias=True)
+    # Array payloads are tuples and come back as lists
+    assert {key: dumped[key] for key in data} == json.loads(json.dumps(data))
+
+    # Every valid option is also accepted by the top-level validator
+    TimingParameters.model_validate(data)
+
+
+@pytest.mark.parametrize(
+    ("model_cls", "data", "match"),
+    [
+        (
+            TimingOptionB,
+            {
+                "SliceTiming": [0.0, 0.1, 0.2],
+                "VolumeTiming": [0.0, 1.0, 2.0],
+                "AcquisitionDuration": 0.2,  # forbidden in Option B
+            },
+            "must not have acquisition_duration_s",
+        ),
+        (
+            TimingOptionB,
+            {
+                "SliceTiming": [0.0, 0.1, 0.2],
+                "VolumeTiming": [0.0, 2.0, 1.0],  # not monotonically increasing
+            },
+            "monotonically increasing",
+        ),
+        (
+            TimingOptionB,
+            {
+                "SliceTiming": [0.0, 0.1, 0.2],
+                "VolumeTiming": [-1.0, 0.0, 1.0],  # negative value
+            },
+            "Input should be greater than or equal to 0",
+        ),
+        # Missing required fields
+        (
+            TimingOptionB,
+            {"SliceTiming": [0.0, 0.1, 0.2]},
+            "requires volume_timing_s",
+        ),
+        # Top-level validator
+        (TimingParameters, {}, "validation errors"),
+        (
+            TimingParameters,
+            {
+                "RepetitionTime": 1.5,
+                "VolumeTiming": [0.0, 1.0, 2.0],  # no option allows both
+            },
+            "must not have volume_timing_s",
+        ),
+    ],
+)
+def test_timing_option_invalid(model_cls, data, match, timing_options_common_data):
+    """Test invalid timing field combinations and values."""
+    assert_invalid(model_cls, data | timing_options_common_data, match=match)
 
 
-def test_task_information_validation(task_data):
+def test_task_information_validation(task_model):
     """Test TaskInformation model validation."""
-    task = TaskInformation.model_validate(task_data)
-    assert task.task_name == "rest"
-    assert task.task_description == "Resting state acquisition"
+    assert task_model.task_name == "rest"
+    assert task_model.task_description == "Resting state acquisition"
 
     # Test required TaskName
-    with pytest.raises(ValidationError):
-        TaskInformation.model_validate({"TaskDescription": "test"})
+    assert_invalid(TaskInformation, {"TaskDescription": "test"})
 
 
-def test_institution_information_validation(institution_data):
+def test_institution_information_validation(institution_model):
     """Test InstitutionInformation model validation."""
-    inst = InstitutionInformation.model_validate(institution_data)
-    assert inst.institution_name == "Example University"
-    assert inst.institution_address == "123 Example St"
-
-
-def test_complete_sidecar_validation(
-    hardware_data,
-    sequence_data,
-    clutter_filtering_data,
-    power_doppler_data,
-    task_data,
-    timing_option_a_data,
-    institution_data,
-):
+    assert institution_model.institution_name == "Example University"
+    assert institution_model.institution_address == "123 Example St"
+
+
+def test_complete_sidecar_validation(complete_sidecar_data):
     """Test complete FUSISidecar model validation."""
-    valid_data = {
-        **task_data,
-        **hardware_data,
-        **sequence_data,
-        **clutter_filtering_data,
-        **power_doppler_data,
-        **timing_option_a_data,
-        **institution_data,
-    }
-    sidecar = FUSISidecar.model_validate(valid_data)
-    assert sidecar.task_name == task_data["TaskName"]
-    assert sidecar.repetition_time_s == timing_option_a_data["RepetitionTime"]
-    assert sidecar.manufacturer == hardware_data["Manufacturer"]
+    sidecar = FUSISidecar.model_validate(complete_sidecar_data)
+    assert sidecar.task_name == complete_sidecar_data["TaskName"]
+    assert sidecar.repetition_time_s == complete_sidecar_data["RepetitionTime"]
+    assert sidecar.manufacturer == complete_sidecar_data["Manufacturer"]
+
+    # Test validating directly from JSON bytes
+    sidecar_from_json = FUSISidecar.from_json_bytes(
+        json.dumps(complete_sidecar_data).encode()
+    )
+    assert sidecar_from_json == sidecar
+
+    # Test serializing back to JSON bytes with BIDS keys
+    sidecar_json = sidecar.to_json_bytes()
+    assert (
+        json.loads(sidecar_json)["Manufacturer"]
+        == complete_sidecar_data["Manufacturer"]
+    )
+    assert FUSISidecar.from_json_bytes(sidecar_json) == sidecar
+
+
+def test_sidecar_subclass_json_bytes(complete_sidecar_data):
+    """Test that JSON helpers validate and serialize with the subclass schema."""
+
+    class LabSidecar(FUSISidecar):
+        lab_notes: Optional[str] = Field(None, alias="LabNotes")
+
+    sidecar = LabSidecar.model_validate(complete_sidecar_data | {"LabNotes": "ok"})
+    assert json.loads(sidecar.to_json_bytes())["LabNotes"] == "ok"
+
+    sidecar_from_json = LabSidecar.from_json_bytes(sidecar.to_json_bytes())
+    assert type(sidecar_from_json) is LabSidecar
+    assert sidecar_from_json == sidecar
+
+
+@pytest.mark.parametrize(
+    ("member", "expected"),
+    [
+        (SliceEncodingDirection.FIRST, "i"),
+        (SliceEncodingDirection.SECOND, "j"),
+        (SliceEncodingDirection.THIRD, "k"),
+        (SliceEncodingDirection.FIRST_REVERSE, "i-"),
+        (SliceEncodingDirection.SECOND_REVERSE, "j-"),
+        (SliceEncodingDirection.THIRD_REVERSE, "k-"),
+    ],
+)
+def test_slice_encoding_direction_values(member, expected):
+    """Test SliceEncodingDirection enum values."""
+    assert member == expected
 
 
 def test_slice_encoding_direction_validation(timing_options_common_data):
-    """Test SliceEncodingDirection enum validation."""
-    assert SliceEncodingDirection.FIRST == "i"
-    assert SliceEncodingDirection.SECOND == "j"
-    assert SliceEncodingDirection.THIRD == "k"
-    assert SliceEncodingDirection.FIRST_REVERSE == "i-"
-    assert SliceEncodingDirection.SECOND_REVERSE == "j-"
-    assert SliceEncodingDirection.THIRD_REVERSE == "k-"
+    """Test SliceEncodingDirection validation."""
+    assert set(get_args(SliceEncodingDirectionLiteral)) == {
+        direction.value for direction in SliceEncodingDirection
+    }
 
     # Test in TimingParameters
     valid_data = {
@@ -361,7 +376,52 @@ def test_slice_encoding_direction_validation(timing_options_common_data):
     assert timing.slice_encoding_direction == SliceEncodingDirection.FIRST
 
     # Test invalid direction
-    invalid_data = valid_data.copy()
-    invalid_data["SliceEncodingDirection"] = "x"
-    with pytest.raises(ValidationError):
-        TimingParameters.model_validate(invalid_data)
+    assert_invalid(
+        TimingParameters,
+        {
+            "RepetitionTime": 1.5,
+            **timing_options_common_data,
+            "SliceEncodingDirection": "x",
+        },
+    )
+
+
+def test_recommended_fields_logging(monkeypatch, caplog, institution_data):
+    """Test reporting unset RECOMMENDED fields through logging instead of warnings."""
+    monkeypatch.setattr(fusi_bids_pydantic, "_RECOMMENDED_WARNINGS_MODE", "log")
+    data = institution_data | {"InstitutionAddress": None}
+    with caplog.at_level(logging.WARNING, logger="fusi_bids_pydantic"):
+        InstitutionInformation.model_validate(data)
+    assert caplog.messages == ["RECOMMENDED field institution_address is not set."]
+
+
+def test_configure_recommended_warnings(monkeypatch, institution_data):
+    """Test switching RECOMMENDED-field warnings off and back on."""
+    # Restore the module default after the test
+    monkeypatch.setattr(fusi_bids_pydantic, "_RECOMMENDED_WARNINGS_MODE", "warn")
+    data = institution_data | {"InstitutionAddress": None}
+
+    fusi_bids_pydantic.configure_recommended_warnings("off")
+    InstitutionInformation.model_validate(data)  # warnings are errors in tests
+
+    fusi_bids_pydantic.configure_recommended_warnings("warn")
+    with pytest.warns(UserWarning, match="institution_address is not set"):
+        InstitutionInformation.model_validate(data)
+
+    with pytest.raises(ValueError, match="Unknown RECOMMENDED warnings mode"):
+        fusi_bids_pydantic.configure_recommended_warnings("loud")
+
+
+@pytest.mark.parametrize(
+    ("value", "mode"),
+    [("", "warn"), ("warn", "warn"), ("log", "log"), ("off", "off"), ("0", "off")],
+)
+def test_recommended_warnings_mode_from_env(value, mode):
+    """Test mapping FUSI_BIDS_RECOMMENDED_WARNINGS values to modes."""
+    assert fusi_bids_pydantic._recommended_warnings_mode_from_env(value) == mode
+
+
+def test_recommended_warnings_mode_from_env_unknown():
+    """Test that an unknown FUSI_BIDS_RECOMMENDED_WARNINGS value warns."""
+    with pytest.warns(UserWarning, match="Unknown RECOMMENDED warnings mode"):
+        assert fusi_bids_pydantic._recommended_warnings_mode_from_env("of") == "warn"
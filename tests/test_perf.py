@@ -0,0 +1,25 @@
+"""Benchmarks for fUSI-BIDS Pydantic model validation."""
+
+import json
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from fusi_bids_pydantic import FUSISidecar
+
+# Deselected by default; run with `make benchmark`
+pytestmark = pytest.mark.benchmark
+
+
+def test_sidecar_validate_bench(benchmark, complete_sidecar_data):
+    """Benchmark validating a complete sidecar from a dict."""
+    sidecar = benchmark(FUSISidecar.model_validate, complete_sidecar_data)
+    assert sidecar.task_name == complete_sidecar_data["TaskName"]
+
+
+def test_sidecar_validate_json_bench(benchmark, complete_sidecar_data):
+    """Benchmark validating a complete sidecar from JSON bytes."""
+    data = json.dumps(complete_sidecar_data).encode()
+    sidecar = benchmark(FUSISidecar.from_json_bytes, data)
+    assert sidecar.task_name == complete_sidecar_data["TaskName"]